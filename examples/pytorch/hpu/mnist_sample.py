@@ -23,10 +23,11 @@ from torch.nn import functional as F
 class LitClassifier(LightningModule):
     def __init__(self):
         super().__init__()
+        self.flatten = torch.nn.Flatten()
         self.l1 = torch.nn.Linear(28 * 28, 10)
 
     def forward(self, x):
-        return torch.relu(self.l1(x.view(x.size(0), -1)))
+        return self.l1(self.flatten(x))
 
     def training_step(self, batch, batch_idx):
         x, y = batch
@@ -36,17 +37,17 @@ class LitClassifier(LightningModule):
         x, y = batch
         probs = self(x)
         acc = self.accuracy(probs, y)
-        self.log("val_acc", acc)
+        self.log("val_acc", acc, sync_dist=True)
 
     def test_step(self, batch, batch_idx):
         x, y = batch
         logits = self(x)
         acc = self.accuracy(logits, y)
-        self.log("test_acc", acc)
+        self.log("test_acc", acc, sync_dist=True)
 
     @staticmethod
     def accuracy(logits, y):
-        return torch.sum(torch.eq(torch.argmax(logits, -1), y).to(torch.float32)) / len(y)
+        return torch.argmax(logits, -1).eq_(y).to(torch.float32).mean()
 
     def configure_optimizers(self):
         return torch.optim.Adam(self.parameters(), lr=0.02)
@@ -60,7 +61,7 @@ if __name__ == "__main__":
             "accelerator": "hpu",
             "devices": 1,
             "max_epochs": 1,
-            "plugins": lazy_instance(HPUPrecisionPlugin, precision="16-mixed"),
+            "plugins": lazy_instance(HPUPrecisionPlugin, precision="bf16-mixed"),
         },
         run=False,
         save_config_kwargs={"overwrite": True},
@@ -68,5 +69,4 @@ if __name__ == "__main__":
 
     # Run the model ⚡
     cli.trainer.fit(cli.model, datamodule=cli.datamodule)
-    cli.trainer.validate(cli.model, datamodule=cli.datamodule)
     cli.trainer.test(cli.model, datamodule=cli.datamodule)